@@ -11,9 +11,15 @@ Designed to work on exported TOMLs under final/<CODE>/readme.toml.
 from __future__ import annotations
 
 import argparse
+import io
 import json
+import os
 import re
-import textwrap
+import stat
+import sys
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 try:
@@ -21,35 +27,76 @@ try:
 except ModuleNotFoundError:  # pragma: no cover
     import tomli as tomllib  # type: ignore
 
+try:
+    import orjson  # optional: faster --use-cache sidecar reads
+except ModuleNotFoundError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+
+_GRADES_SUMMARY_CACHE: dict[Path, tuple[int, dict]] = {}
+_FIND_UPWARDS_CACHE: dict[tuple[Path, str], Path | None] = {}
+
+
+def clear_caches() -> None:
+    """Drop all memoized state (grades summaries and per-string render caches)."""
+    _GRADES_SUMMARY_CACHE.clear()
+    _FIND_UPWARDS_CACHE.clear()
+    _normalize_multiline_md.cache_clear()
+    _encode_shields_component.cache_clear()
 
-_GRADES_SUMMARY_CACHE: dict[Path, dict] = {}
+
+def _is_file(path: Path) -> bool:
+    # One stat() instead of exists() + is_file().
+    try:
+        return stat.S_ISREG(path.stat().st_mode)
+    except OSError:
+        return False
 
 
 def _find_upwards(start: Path, filename: str) -> Path | None:
     cur = start.resolve()
     if cur.is_file():
         cur = cur.parent
+    # Every directory walked resolves to the same answer; remember it for all
+    # of them so sibling TOMLs under one repo root only pay for the first walk.
+    walked: list[Path] = []
+    found: Path | None = None
     for p in [cur, *cur.parents]:
+        key = (p, filename)
+        if key in _FIND_UPWARDS_CACHE:
+            found = _FIND_UPWARDS_CACHE[key]
+            break
+        walked.append(p)
         cand = p / filename
-        if cand.exists() and cand.is_file():
-            return cand
-    return None
+        if _is_file(cand):
+            found = cand
+            break
+    for p in walked:
+        _FIND_UPWARDS_CACHE[(p, filename)] = found
+    return found
 
 
 def _load_grades_summary(toml_path: Path) -> dict:
     path = _find_upwards(toml_path, "grades_summary.json")
     if not path:
         return {}
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        return {}
     cached = _GRADES_SUMMARY_CACHE.get(path)
-    if cached is not None:
-        return cached
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        # json.loads accepts UTF-8 bytes; skip the intermediate str.
+        data = json.loads(path.read_bytes())
     except Exception:
         data = {}
     if not isinstance(data, dict):
         data = {}
-    _GRADES_SUMMARY_CACHE[path] = data
+    # Badge names/percents go straight into the markdown; keep them LF-only too.
+    data = _lf_tree(data)
+    _GRADES_SUMMARY_CACHE[path] = (mtime_ns, data)
     return data
 
 
@@ -62,9 +109,8 @@ def _pick_grades_variant(entry: object) -> list[dict]:
     if "default" in entry and isinstance(entry.get("default"), list):
         return [x for x in entry.get("default") if isinstance(x, dict)]
 
-    keys = [k for k in entry.keys() if isinstance(k, str)]
-    preferred = [k for k in keys if "default" in k.lower()]
-    pick_key = (sorted(preferred)[0] if preferred else (sorted(keys)[0] if keys else ""))
+    keys = tuple(k for k in entry if isinstance(k, str))
+    pick_key = min((k for k in keys if "default" in k.lower()), default="") or min(keys, default="")
     if pick_key and isinstance(entry.get(pick_key), list):
         return [x for x in entry.get(pick_key) if isinstance(x, dict)]
     return []
@@ -74,17 +120,12 @@ def _render_grades_badges_from_items(items: list[dict]) -> list[str]:
     if not items:
         return []
 
-    badges: list[str] = []
-    badges.append(_render_shields_badge(alt="成绩构成", label="成绩构成", message=None, color="gold"))
+    segments: list[tuple[str, str]] = []
     for it in items:
-        name = _s(it.get("name")).strip()
-        percent = _s(it.get("percent")).strip()
-        if not name:
-            continue
-        alt = f"{name}{percent}" if percent else name
-        badges.append(_render_shields_badge(alt=alt, label=name, message=percent or "", color="wheat"))
-
-    return badges
+        name = _ss(it.get("name"))
+        if name:
+            segments.append((name, _ss(it.get("percent"))))
+    return _emit_kv_badges("成绩构成", segments)
 
 
 def _as_list(value):
@@ -103,11 +144,42 @@ def _s(value: object) -> str:
     return str(value)
 
 
+def _ss(value: object) -> str:
+    """Like `_s(value).strip()`, without the intermediate string for non-str values."""
+    if type(value) is str:
+        return value.strip()
+    return "" if value is None else str(value).strip()
+
+
+_re_crlf = re.compile(r"\r\n?")
+
+
+def _lf(text: str) -> str:
+    return _re_crlf.sub("\n", text) if "\r" in text else text
+
+
+def _lf_tree(value):
+    """Normalize newlines in every string of a parsed TOML tree.
+
+    Done once at load time so the render helpers can assume LF-only text.
+    Keys are interned too: parsed keys are fresh strings, and interning lets the
+    renderers' literal-key lookups match by identity.
+    """
+    if isinstance(value, str):
+        return _lf(value)
+    if isinstance(value, dict):
+        return {sys.intern(k): _lf_tree(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_lf_tree(v) for v in value]
+    return value
+
+
 def _md_escape_inline(text: str) -> str:
     # conservative escaping for headings / inline.
-    return text.replace("\r\n", "\n").replace("\r", "\n").strip()
+    return text.strip()
 
 
+@lru_cache(maxsize=4096)
 def _normalize_multiline_md(text: str) -> str:
     """Normalize multiline markdown stored in TOML triple-quoted strings.
 
@@ -116,9 +188,39 @@ def _normalize_multiline_md(text: str) -> str:
     leaving the rest misaligned in the generated README.
     """
 
-    s = _s(text).replace("\r\n", "\n").replace("\r", "\n")
-    s = textwrap.dedent(s)
-    return s.strip()
+    return _fast_dedent(_s(text))
+
+
+def _fast_dedent(s: str) -> str:
+    """Equivalent of `textwrap.dedent(s).strip()` in a single scan without regexes.
+
+    Same rules as `textwrap.dedent`: lines holding only spaces/tabs are emptied
+    and ignored, and the longest common leading run of spaces/tabs is removed.
+    """
+
+    if "\n" not in s:
+        return s.strip()
+    lines = s.split("\n")
+    margin: str | None = None
+    for i, ln in enumerate(lines):
+        body = ln.lstrip(" \t")
+        if not body:
+            lines[i] = ""
+            continue
+        indent = ln[: len(ln) - len(body)]
+        if margin is None or margin.startswith(indent):
+            margin = indent
+        elif not indent.startswith(margin):
+            n = 0
+            for x, y in zip(margin, indent):
+                if x != y:
+                    break
+                n += 1
+            margin = margin[:n]
+    if margin:
+        n = len(margin)
+        lines = [ln[n:] for ln in lines]
+    return "\n".join(lines).strip()
 
 
 def _as_author_list(author: object) -> list[dict]:
@@ -132,9 +234,9 @@ def _as_author_list(author: object) -> list[dict]:
 
 
 def _render_one_author_quote(author: dict, *, indent: str = "") -> str:
-    name = _s(author.get("name")).strip()
-    link = _s(author.get("link")).strip()
-    date = _s(author.get("date")).strip()
+    name = _ss(author.get("name"))
+    link = _ss(author.get("link"))
+    date = _ss(author.get("date"))
 
     # Skip rendering anonymous signatures.
     if name in {"佚名", "匿名"} and not link and not date:
@@ -190,9 +292,9 @@ def _author_sig_key(author: object) -> tuple[tuple[str, str, str], ...]:
     for a in authors:
         key.append(
             (
-                _s(a.get("name")).strip(),
-                _s(a.get("link")).strip(),
-                _s(a.get("date")).strip(),
+                _ss(a.get("name")),
+                _ss(a.get("link")),
+                _ss(a.get("date")),
             )
         )
     return tuple(key)
@@ -215,6 +317,11 @@ def _render_author_quote_inline(author: object) -> str:
     return ("\n\n" + q) if q else ""
 
 
+# Minimal escaping that preserves readable CJK while keeping URLs valid.
+_SHIELDS_TABLE = str.maketrans({"-": "--", "%": "%25", " ": "%20"})
+
+
+@lru_cache(maxsize=1024)
 def _encode_shields_component(text: str) -> str:
     """Encode a single shields.io path component.
 
@@ -222,31 +329,49 @@ def _encode_shields_component(text: str) -> str:
     '%' must be percent-encoded to avoid breaking URLs.
     """
 
-    s = _s(text).strip()
+    s = _ss(text)
     if not s:
         return ""
-    s = s.replace("-", "--")
-    # Minimal escaping that preserves readable CJK while keeping URLs valid.
-    s = s.replace("%", "%25")
-    s = s.replace(" ", "%20")
-    return s
+    return s.translate(_SHIELDS_TABLE)
+
+
+_BADGE_BASE = "https://img.shields.io/badge/"
+# Badge colors and the fixed basic-info labels come from a tiny vocabulary;
+# encode them once up front so the common case is a plain dict lookup.
+_ENCODED = {
+    c: _encode_shields_component(c)
+    for c in ("gold", "wheat", "moccasin", "brightgreen", "学分", "学时构成", "成绩构成")
+}
 
 
 def _render_shields_badge(*, alt: str, label: str, message: str | None = None, color: str | None = None) -> str:
-    base = "https://img.shields.io/badge/"
+    enc_label = _ENCODED.get(label) or _encode_shields_component(label)
     if message is None and color is not None:
         # Two-part variant: /badge/<label>-<message>
-        path = f"{_encode_shields_component(label)}-{_encode_shields_component(color)}"
-    else:
-        msg = "" if message is None else message
-        col = "brightgreen" if color is None else color
-        path = (
-            f"{_encode_shields_component(label)}-"
-            f"{_encode_shields_component(msg)}-"
-            f"{_encode_shields_component(col)}"
-        )
+        enc_color = _ENCODED.get(color) or _encode_shields_component(color)
+        return f"![{alt}]({_BADGE_BASE}{enc_label}-{enc_color})"
+    msg = "" if message is None else message
+    col = "brightgreen" if color is None else color
+    enc_color = _ENCODED.get(col) or _encode_shields_component(col)
     # Keep alt readable; URL part is encoded.
-    return f"![{alt}]({base}{path})"
+    return f"![{alt}]({_BADGE_BASE}{enc_label}-{_encode_shields_component(msg)}-{enc_color})"
+
+
+def _emit_kv_badges(header: str, segments: Iterable[tuple[str, str]]) -> list[str]:
+    """A gold header badge followed by one wheat badge per (label, value) segment."""
+    badges = [_render_shields_badge(alt=header, label=header, message=None, color="gold")]
+    for label, value in segments:
+        alt = f"{label}{value}" if value else label
+        badges.append(_render_shields_badge(alt=alt, label=label, message=value, color="wheat"))
+    return badges
+
+
+def _is_numeric_tail(t: str) -> bool:
+    """True for an integer/decimal with optional '%' (e.g. '32', '16.5', '30%')."""
+    if t.endswith("%"):
+        t = t[:-1]
+    whole, dot, frac = t.partition(".")
+    return whole.isdecimal() and (not dot or frac.isdecimal())
 
 
 def _split_label_value_tail(text: str) -> tuple[str, str]:
@@ -255,15 +380,15 @@ def _split_label_value_tail(text: str) -> tuple[str, str]:
     Falls back to (text,'') when no obvious tail value exists.
     """
 
-    s = _s(text).strip()
+    s = _ss(text)
     if not s:
         return ("", "")
     parts = s.split()
     if len(parts) < 2:
         return (s, "")
-    tail = parts[-1].strip()
-    if re.fullmatch(r"\d+(?:\.\d+)?%?", tail):
-        label = "".join(parts[:-1]).strip()
+    tail = parts[-1]
+    if _is_numeric_tail(tail):
+        label = "".join(parts[:-1])
         return (label or s, tail)
     return (s, "")
 
@@ -277,10 +402,19 @@ def _render_basic_info_badges(content: str) -> list[str]:
 
     kv: dict[str, str] = {}
     for ln in text.split("\n"):
-        m = re.match(r"^\s*【(?P<k>[^】]+)】\s*[:：]\s*(?P<v>.*\S)\s*$", ln)
-        if not m:
+        # 【key】: value  (ASCII or full-width colon)
+        ln = ln.lstrip()
+        if not ln.startswith("【"):
+            continue
+        k, sep, rest = ln[1:].partition("】")
+        if not sep or not k:
+            continue
+        rest = rest.lstrip()
+        if not rest.startswith((":", "：")):
             continue
-        kv[m.group("k").strip()] = m.group("v").strip()
+        v = rest[1:].strip()
+        if v:
+            kv[k.strip()] = v
 
     badges: list[str] = []
 
@@ -299,23 +433,12 @@ def _render_basic_info_badges(content: str) -> list[str]:
             )
         )
 
-    hours = kv.get("学时构成")
-    if hours:
-        ensure_blank_sep()
-        badges.append(_render_shields_badge(alt="学时构成", label="学时构成", message=None, color="gold"))
-        for seg in [p.strip() for p in hours.split("|") if p.strip()]:
-            label, value = _split_label_value_tail(seg)
-            alt = f"{label}{value}" if value else label
-            badges.append(_render_shields_badge(alt=alt, label=label, message=value or "", color="wheat"))
-
-    grading = kv.get("成绩构成")
-    if grading:
-        ensure_blank_sep()
-        badges.append(_render_shields_badge(alt="成绩构成", label="成绩构成", message=None, color="gold"))
-        for seg in [p.strip() for p in grading.split("|") if p.strip()]:
-            label, value = _split_label_value_tail(seg)
-            alt = f"{label}{value}" if value else label
-            badges.append(_render_shields_badge(alt=alt, label=label, message=value or "", color="wheat"))
+    for header in ("学时构成", "成绩构成"):
+        value = kv.get(header)
+        if value:
+            ensure_blank_sep()
+            segments = (_split_label_value_tail(seg) for seg in value.split("|") if seg.strip())
+            badges.extend(_emit_kv_badges(header, segments))
 
     # Trim trailing blank.
     while badges and badges[-1] == "":
@@ -338,12 +461,26 @@ def _render_block(content: str, author: object = None) -> str:
 
 _re_heading = re.compile(r"^#{1,6}\s+")
 _re_list = re.compile(r"^\s*(?:[-*+]\s+|\d+[.)]\s+)")
-_re_ul_marker = re.compile(r"^(?P<indent>\s*)[*+]\s+")
-_re_ul_dash = re.compile(r"^(?P<indent>\s*)-\s+")
-_re_ol_marker = re.compile(r"^(?P<indent>\s*)(?P<num>\d+)(?P<delim>[.)])\s+")
+_re_line_kind = re.compile(r"^(?P<ind>\s*)(?:(?P<ol>\d+)(?P<oldelim>[.)])\s+|(?P<ul>[-*+])\s+)?(?P<rest>.*)$")
 _re_bare_url = re.compile(r"(?<!\()(?<!<)https?://[^\s>]+")
 _re_bold_only = re.compile(r"^(?P<indent>\s*)(?:\*\*|__)(?P<text>.+?)(?:\*\*|__)\s*$")
 _re_heading_level = re.compile(r"^(?P<marks>#{1,6})\s+")
+_re_bq_prefix = re.compile(r"^(\s*(?:>\s*)+)(.*)$")
+_re_bq_blank = re.compile(r"\s*(?:>\s*)+\s*")
+_re_orphan_ul = re.compile(r"\s*[-*+]\s*")
+_re_orphan_ol = re.compile(r"\s*\d+[.)]\s*")
+_re_pct_tail = re.compile(r"\b\d+%\s*$")
+_re_pct_paren = re.compile(r"[（(]\s*\d+%\s*[）)]\s*$")
+# Anything _normalize_markdownlint could rewrite: a leading blank line, a line
+# starting with a heading/blockquote/list marker, trailing whitespace (incl.
+# whitespace-only lines), 3+ newlines, bold markers, bare URLs or tabs.
+_re_lint_trigger = re.compile(
+    r"\A\n|^[^\S\n]*(?:[#>]|[-*+](?:\s|$)|\d+[.)](?:\s|$))|[^\S\n]$|\n\n\n|\*\*|__|https?://|\t",
+    re.MULTILINE,
+)
+
+# Initial size of the per-indent list state arrays; grown on demand.
+_LIST_STATE_SLOTS = 16
 
 
 def _normalize_markdownlint(md: str) -> str:
@@ -362,25 +499,38 @@ def _normalize_markdownlint(md: str) -> str:
     - MD036: bold-only line -> heading
     """
 
-    md = md.replace("\r\n", "\n").replace("\r", "\n")
+    # Renderer input is LF-normalized at load time; this only guards other callers.
+    if "\r" in md:
+        md = _lf(md)
+
+    # Fast path: most content blocks are already clean.
+    if not _re_lint_trigger.search(md):
+        return md.rstrip() + "\n"
+
     src = [ln.rstrip() for ln in md.split("\n")]
 
     def is_blank(ln: str) -> bool:
         return ln.strip() == ""
 
+    # Cheap substring checks below reject most lines before any regex runs:
+    # a blockquote prefix needs ">", a heading needs "#", a fence needs "```".
     def split_blockquote_prefix(ln: str) -> tuple[str, str]:
-        m = re.match(r"^(?P<prefix>\s*(?:>\s*)+)(?P<body>.*)$", ln)
+        if ">" not in ln:
+            return ("", ln)
+        m = _re_bq_prefix.match(ln)
         if not m:
             return ("", ln)
-        return (m.group("prefix"), m.group("body"))
+        return (m.group(1), m.group(2))
 
     def strip_blockquote(ln: str) -> str:
         return split_blockquote_prefix(ln)[1]
 
     def is_code_fence(ln: str) -> bool:
-        return ln.strip().startswith("```")
+        return "```" in ln and ln.lstrip().startswith("```")
 
     def is_heading(ln: str) -> bool:
+        if "#" not in ln:
+            return False
         return bool(_re_heading.match(strip_blockquote(ln).strip()))
 
     def is_list(ln: str) -> bool:
@@ -390,7 +540,7 @@ def _normalize_markdownlint(md: str) -> str:
         if is_blank(ln):
             return True
         # treat pure blockquote markers as blank lines within a quote
-        return bool(re.fullmatch(r"\s*(?:>\s*)+\s*", ln))
+        return ">" in ln and bool(_re_bq_blank.fullmatch(ln))
 
     def strip_heading_trailing_punct(heading_line: str) -> str:
         s = heading_line.rstrip()
@@ -412,9 +562,14 @@ def _normalize_markdownlint(md: str) -> str:
 
     # State for list normalization.
     list_indent_stack: list[int] = []
-    ol_counters: dict[str, int] = {}
-    last_list_type: dict[str, str] = {}
-    ol_marker_width: dict[str, int] = {}
+    # Per-indent list state, indexed by indent width. Counters and marker
+    # widths are only read while last_list_type[n] == "ol", and both are
+    # written whenever it becomes "ol", so resetting state only has to clear
+    # the types (up to the highest slot used so far).
+    ol_counters: list[int] = [0] * _LIST_STATE_SLOTS
+    last_list_type: list[str | None] = [None] * _LIST_STATE_SLOTS
+    ol_marker_width: list[int] = [0] * _LIST_STATE_SLOTS
+    list_types_used = 0
     last_heading_level = 0
     prev_list: tuple[str, str, int, str] | None = None  # (quote_prefix, kind, indent_len, rest)
 
@@ -423,7 +578,7 @@ def _normalize_markdownlint(md: str) -> str:
         raw_src = src[i]
         # markdownlint counts indentation in spaces; some sources use tabs.
         # Preserve tabs inside fenced code blocks, but normalize elsewhere.
-        raw = raw_src if in_code or is_code_fence(raw_src) else raw_src.expandtabs(4)
+        raw = raw_src if in_code or "\t" not in raw_src or is_code_fence(raw_src) else raw_src.expandtabs(4)
 
         if is_code_fence(raw_src):
             in_code = not in_code
@@ -447,8 +602,8 @@ def _normalize_markdownlint(md: str) -> str:
         quote_prefix, body = split_blockquote_prefix(raw)
 
         # MD034: wrap bare URLs as <...>
-        if "http://" in body or "https://" in body:
-            body = _re_bare_url.sub(lambda m: f"<{m.group(0)}>", body)
+        if "://" in body:
+            body = _re_bare_url.sub(r"<\g<0>>", body)
 
         # MD036: bold-only line -> heading (only outside blockquote)
         if not quote_prefix:
@@ -459,17 +614,23 @@ def _normalize_markdownlint(md: str) -> str:
                     level = min(max(last_heading_level + 1, 2), 6)
                     body = "#" * level + " " + text
 
+        # One combined match decides list kind, indentation and numbering.
+        # The marker's trailing whitespace is consumed by the pattern, so
+        # `rest` never starts with whitespace.
+        m_kind = _re_line_kind.match(body)
+        ind = m_kind.group("ind")
+        num = m_kind.group("ol")
+        delim = m_kind.group("oldelim")
+        rest = m_kind.group("rest")
+        is_list_line = bool(num or m_kind.group("ul"))
+
         # MD004 / MD030: normalize unordered list markers/spaces.
-        m_ul = _re_ul_marker.match(body)
-        if m_ul:
-            body = f"{m_ul.group('indent')}- " + body[m_ul.end() :].lstrip()
-        m_dash = _re_ul_dash.match(body)
-        if m_dash:
-            body = f"{m_dash.group('indent')}- " + body[m_dash.end() :].lstrip()
+        if is_list_line and not num:
+            body = f"{ind}- {rest}"
 
         # Drop orphan list markers (e.g. a line that is just "-"), which can
         # otherwise trigger MD007/MD032 and break list parsing.
-        if re.fullmatch(r"\s*[-*+]\s*", body) or re.fullmatch(r"\s*\d+[.)]\s*", body):
+        if (not is_list_line or not rest) and (_re_orphan_ul.fullmatch(body) or _re_orphan_ol.fullmatch(body)):
             out.append(quote_prefix.rstrip() if quote_prefix else "")
             i += 1
             continue
@@ -478,80 +639,69 @@ def _normalize_markdownlint(md: str) -> str:
         # - For ordered lists, up to 3 leading spaces are treated as top-level.
         # - For nested lists, markdownlint expects 2-space indentation per level;
         #   many sources use 4 spaces, so reduce 4->2, 6->4, etc.
-        m_ol_indent = _re_ol_marker.match(body)
-        if m_ol_indent:
-            indent_len = len(m_ol_indent.group("indent"))
-            if indent_len <= 3:
-                norm_indent = ""
-            elif indent_len >= 4:
+        if num:
+            indent_len = len(ind)
+            norm_indent = "" if indent_len <= 3 else " " * (indent_len - 2)
+            body = f"{norm_indent}{num}{delim} {rest}"
+        elif is_list_line:
+            indent_len = len(ind)
+            rest_start = indent_len + 2
+            ends_with_percent = bool(_re_pct_tail.search(rest))
+            looks_like_percent_item = bool(_re_pct_paren.search(rest))
+
+            indent_forced = False
+
+            # Heuristic for score-breakdown lists (common in PE100X):
+            # After a nested explanatory bullet, authors sometimes
+            # accidentally keep a 2-space indent for the next top-level
+            # score component, causing MD005/MD007. If we just saw a 2-space
+            # nested bullet without a trailing percent, and the current 2-space
+            # item *does* end with a percent, promote it to top-level.
+            if (
+                indent_len == 2
+                and (ends_with_percent or looks_like_percent_item)
+                and prev_list is not None
+                and prev_list[0] == quote_prefix
+                and prev_list[1] == "ul"
+                and prev_list[2] == 2
+                and not (_re_pct_tail.search(prev_list[3]) or _re_pct_paren.search(prev_list[3]))
+            ):
+                body = f"- " + body[rest_start:].lstrip()
+                indent_len = 0
+
+            # Treat lightly-indented percent-items as top-level list entries.
+            if indent_len <= 3 and looks_like_percent_item:
+                body = f"- " + body[rest_start:].lstrip()
+            # If we're inside an ordered list item, nested unordered lists
+            # must be indented by at least the ordered marker width (e.g.
+            # "1. " => 3, "10. " => 4). A common mistake is using 2 spaces,
+            # which markdownlint reads as an indented top-level list.
+            if list_indent_stack:
+                # Find the nearest ordered-list ancestor.
+                for parent_indent_len in reversed(list_indent_stack):
+                    if last_list_type[parent_indent_len] != "ol":
+                        continue
+                    desired = parent_indent_len + ol_marker_width[parent_indent_len]
+                    # Only treat as nested when it is already indented under that OL level.
+                    if indent_len > parent_indent_len:
+                        # If it's too shallow (e.g. 2 spaces under a "10."), promote it.
+                        if indent_len < desired or indent_len != desired:
+                            body = f"{' ' * desired}- " + body[rest_start:].lstrip()
+                            indent_len = desired
+                        indent_forced = True
+                    break
+
+            # Reduce common 4-space nested lists to markdownlint's 2-space style.
+            if not indent_forced and indent_len >= 4:
                 norm_indent = " " * max(0, indent_len - 2)
-            else:
-                norm_indent = m_ol_indent.group("indent")
-            body = (
-                f"{norm_indent}{m_ol_indent.group('num')}{m_ol_indent.group('delim')} "
-                + body[m_ol_indent.end() :].lstrip()
-            )
-        else:
-            m_ul_indent = _re_ul_dash.match(body)
-            if m_ul_indent:
-                indent_len = len(m_ul_indent.group("indent"))
-                rest = body[m_ul_indent.end() :].strip()
-                ends_with_percent = bool(re.search(r"\b\d+%\s*$", rest))
-                looks_like_percent_item = bool(re.search(r"[（(]\s*\d+%\s*[）)]\s*$", rest))
-
-                indent_forced = False
-
-                # Heuristic for score-breakdown lists (common in PE100X):
-                # After a nested explanatory bullet, authors sometimes
-                # accidentally keep a 2-space indent for the next top-level
-                # score component, causing MD005/MD007. If we just saw a 2-space
-                # nested bullet without a trailing percent, and the current 2-space
-                # item *does* end with a percent, promote it to top-level.
-                if (
-                    indent_len == 2
-                    and (ends_with_percent or looks_like_percent_item)
-                    and prev_list is not None
-                    and prev_list[0] == quote_prefix
-                    and prev_list[1] == "ul"
-                    and prev_list[2] == 2
-                    and not (re.search(r"\b\d+%\s*$", prev_list[3]) or re.search(r"[（(]\s*\d+%\s*[）)]\s*$", prev_list[3]))
-                ):
-                    body = f"- " + body[m_ul_indent.end() :].lstrip()
-                    indent_len = 0
-
-                # Treat lightly-indented percent-items as top-level list entries.
-                if indent_len <= 3 and looks_like_percent_item:
-                    body = f"- " + body[m_ul_indent.end() :].lstrip()
-                # If we're inside an ordered list item, nested unordered lists
-                # must be indented by at least the ordered marker width (e.g.
-                # "1. " => 3, "10. " => 4). A common mistake is using 2 spaces,
-                # which markdownlint reads as an indented top-level list.
-                if list_indent_stack:
-                    # Find the nearest ordered-list ancestor.
-                    for parent_indent_len in reversed(list_indent_stack):
-                        parent_indent = " " * parent_indent_len
-                        if last_list_type.get(parent_indent) != "ol" or parent_indent not in ol_marker_width:
-                            continue
-                        desired = parent_indent_len + ol_marker_width[parent_indent]
-                        # Only treat as nested when it is already indented under that OL level.
-                        if indent_len > parent_indent_len:
-                            # If it's too shallow (e.g. 2 spaces under a "10."), promote it.
-                            if indent_len < desired or indent_len != desired:
-                                body = f"{' ' * desired}- " + body[m_ul_indent.end() :].lstrip()
-                                indent_len = desired
-                            indent_forced = True
-                        break
-
-                # Reduce common 4-space nested lists to markdownlint's 2-space style.
-                if not indent_forced and indent_len >= 4:
-                    norm_indent = " " * max(0, indent_len - 2)
-                    body = f"{norm_indent}- " + body[m_ul_indent.end() :].lstrip()
+                body = f"{norm_indent}- " + body[rest_start:].lstrip()
 
         # Headings (only outside blockquote): ensure blank line before/after.
-        if not quote_prefix and bool(_re_heading.match(body.strip())):
+        if not quote_prefix and not is_list_line and bool(_re_heading.match(body.strip())):
             list_indent_stack.clear()
-            ol_counters.clear()
-            last_list_type.clear()
+            if list_types_used:
+                last_list_type[:list_types_used] = [None] * list_types_used
+                list_types_used = 0
             m_h = _re_heading_level.match(body.strip())
             if m_h:
                 last_heading_level = len(m_h.group("marks"))
@@ -564,7 +714,7 @@ def _normalize_markdownlint(md: str) -> str:
             continue
 
         # MD007: dedent accidentally-indented top-level lists.
-        if bool(_re_list.match(body)):
+        if is_list_line:
             indent_len = leading_ws_len(body)
             if indent_len > 0 and not list_indent_stack:
                 body = body[indent_len:]
@@ -582,150 +732,149 @@ def _normalize_markdownlint(md: str) -> str:
                     list_indent_stack.clear()
 
         # MD029 / MD030: normalize ordered list numbering and spacing.
-        m_ol = _re_ol_marker.match(body)
-        if m_ol:
-            indent = m_ol.group("indent")
-            delim = m_ol.group("delim")
+        if is_list_line:
+            if indent_len >= len(last_list_type):
+                grow = indent_len + 1 - len(last_list_type)
+                ol_counters.extend([0] * grow)
+                last_list_type.extend([None] * grow)
+                ol_marker_width.extend([0] * grow)
+            if indent_len >= list_types_used:
+                list_types_used = indent_len + 1
+        if num:
+            indent = body[:indent_len]
             # Track ordered marker width for nested-list indentation.
-            ol_marker_width[indent] = len(m_ol.group("num")) + 2  # e.g. "1. " => 3, "10. " => 4
-            if last_list_type.get(indent) != "ol":
-                ol_counters[indent] = 1
+            ol_marker_width[indent_len] = len(num) + 2  # e.g. "1. " => 3, "10. " => 4
+            if last_list_type[indent_len] != "ol":
+                ol_counters[indent_len] = 1
             else:
-                ol_counters[indent] = ol_counters.get(indent, 0) + 1
-            last_list_type[indent] = "ol"
-            body = f"{indent}{ol_counters[indent]}{delim} " + body[m_ol.end() :].lstrip()
-        elif bool(_re_list.match(body)):
-            indent = body[: leading_ws_len(body)]
-            last_list_type[indent] = "ul"
-            ol_counters.pop(indent, None)
-            ol_marker_width.pop(indent, None)
-        else:
-            ol_counters.clear()
-            last_list_type.clear()
-            ol_marker_width.clear()
+                ol_counters[indent_len] += 1
+            last_list_type[indent_len] = "ol"
+            body = f"{indent}{ol_counters[indent_len]}{delim} {rest}"
+        elif is_list_line:
+            last_list_type[indent_len] = "ul"
+        elif list_types_used:
+            last_list_type[:list_types_used] = [None] * list_types_used
+            list_types_used = 0
 
         # MD032: blank line before list blocks.
-        if bool(_re_list.match(body)):
+        if is_list_line:
             if out and not is_blankish(out[-1]) and not is_heading(out[-1]) and not is_list(out[-1]):
                 out.append(quote_prefix.rstrip() if quote_prefix else "")
-            out.append((quote_prefix + body).rstrip())
-            m_ol_prev = _re_ol_marker.match(body)
-            if m_ol_prev:
-                prev_list = (quote_prefix, "ol", len(m_ol_prev.group("indent")), body[m_ol_prev.end() :].strip())
+            line = quote_prefix + body if quote_prefix else body
+            out.append(line.rstrip() if line[-1:].isspace() else line)
+            if num:
+                prev_list = (quote_prefix, "ol", indent_len, rest.strip())
             else:
-                m_ul_prev = _re_ul_dash.match(body)
-                if m_ul_prev:
-                    prev_list = (quote_prefix, "ul", len(m_ul_prev.group("indent")), body[m_ul_prev.end() :].strip())
-                else:
-                    prev_list = None
+                prev_list = (quote_prefix, "ul", indent_len, body[indent_len + 1 :].strip())
             i += 1
             continue
 
-        out.append((quote_prefix + body).rstrip())
+        line = quote_prefix + body if quote_prefix else body
+        out.append(line.rstrip() if line[-1:].isspace() else line)
         prev_list = None
         i += 1
 
-    # Ensure blank line after list blocks (including within blockquotes)
-    out2: list[str] = []
-    in_code = False
-    i = 0
-    while i < len(out):
-        ln = out[i]
-        if is_code_fence(ln):
-            in_code = not in_code
-            out2.append(ln)
-            i += 1
-            continue
-        if in_code:
-            out2.append(ln)
-            i += 1
-            continue
-
-        out2.append(ln)
-        if is_list(ln):
+    def with_list_terminators(lines: list[str]):
+        # Ensure blank line after list blocks (including within blockquotes)
+        in_code = False
+        n = len(lines)
+        for i, ln in enumerate(lines):
+            yield ln
+            if is_code_fence(ln):
+                in_code = not in_code
+                continue
+            if in_code or not is_list(ln):
+                continue
             j = i + 1
-            while j < len(out) and is_blankish(out[j]):
+            while j < n and is_blankish(lines[j]):
                 j += 1
-            if j < len(out) and not is_list(out[j]):
-                if i + 1 < len(out) and not is_blankish(out[i + 1]):
+            if j < n and not is_list(lines[j]):
+                if i + 1 < n and not is_blankish(lines[i + 1]):
                     q_prefix, _ = split_blockquote_prefix(ln)
-                    out2.append(q_prefix.rstrip() if q_prefix else "")
-        i += 1
-
-    # Collapse multiple blank lines to single blank line (treat quote-blank as blank)
-    collapsed: list[str] = []
+                    yield q_prefix.rstrip() if q_prefix else ""
+
+    # Remaining passes are fused into a single writer:
+    # - collapse multiple blank lines to a single blank line (treat quote-blank
+    #   as blank) and drop leading/trailing blank lines
+    # - headings: MD025 + MD024 + MD026
+    buf = io.StringIO()
+    write = buf.write
+    seen_headings: set[str] = set()
+    dup_counts: dict[str, int] | None = None
+    have_h1 = False
+    in_code = False
+    started = False
+    pending_blank: str | None = None
     blank_run = 0
-    for ln in out2:
+    for ln in with_list_terminators(out):
         if is_blankish(ln):
             blank_run += 1
-            if blank_run > 1:
-                continue
-            # preserve quote-blank lines as plain blank for simplicity
-            collapsed.append(ln if ln.strip().startswith(">") else "")
-        else:
-            blank_run = 0
-            collapsed.append(ln)
-
-    while collapsed and is_blankish(collapsed[0]):
-        collapsed.pop(0)
-    while collapsed and is_blankish(collapsed[-1]):
-        collapsed.pop()
+            if blank_run == 1:
+                # preserve quote-blank lines as plain blank for simplicity
+                pending_blank = ln if ln.strip().startswith(">") else ""
+            continue
+        blank_run = 0
+        if pending_blank is not None:
+            if started:
+                write(pending_blank)
+                write("\n")
+            pending_blank = None
+        started = True
 
-    # Post-pass headings: MD025 + MD024 + MD026
-    final_lines: list[str] = []
-    heading_counts: dict[str, int] = {}
-    have_h1 = False
-    in_code = False
-    for ln in collapsed:
         if is_code_fence(ln):
             in_code = not in_code
-            final_lines.append(ln)
-            continue
-        if in_code:
-            final_lines.append(ln)
-            continue
-
-        q_prefix, body = split_blockquote_prefix(ln)
-        s = body.strip()
-        m = _re_heading_level.match(s)
-        if m and not q_prefix:
-            # normalize punctuation
-            s2 = strip_heading_trailing_punct(s)
-            m2 = _re_heading_level.match(s2)
-            marks = m2.group("marks") if m2 else m.group("marks")
-            level = len(marks)
-            text = (s2[m2.end() :] if m2 else s[m.end() :]).strip()
-
-            if level == 1:
-                if have_h1:
-                    level = 2
+        elif not in_code:
+            q_prefix, body = split_blockquote_prefix(ln)
+            s = body.strip()
+            m = _re_heading_level.match(s)
+            if m and not q_prefix:
+                # normalize punctuation
+                s2 = strip_heading_trailing_punct(s)
+                m2 = _re_heading_level.match(s2)
+                marks = m2.group("marks") if m2 else m.group("marks")
+                level = len(marks)
+                text = (s2[m2.end() :] if m2 else s[m.end() :]).strip()
+
+                if level == 1:
+                    if have_h1:
+                        level = 2
+                    else:
+                        have_h1 = True
+
+                # Headings are usually unique: a set answers that, and the
+                # counter dict is only created once a duplicate shows up.
+                if text in seen_headings:
+                    if dup_counts is None:
+                        dup_counts = {}
+                    n = dup_counts.get(text, 1) + 1
+                    dup_counts[text] = n
+                    text = f"{text}（{n}）"
                 else:
-                    have_h1 = True
+                    seen_headings.add(text)
 
-            heading_counts[text] = heading_counts.get(text, 0) + 1
-            if heading_counts[text] > 1:
-                text = f"{text}（{heading_counts[text]}）"
+                ln = "#" * level + " " + text
+        write(ln)
+        write("\n")
 
-            final_lines.append("#" * level + " " + text)
-        else:
-            final_lines.append(ln)
-
-    return "\n".join(final_lines).rstrip() + "\n"
+    return buf.getvalue().rstrip() + "\n"
 
 
 def _render_content_only(content: str) -> str:
     return _normalize_multiline_md(content)
 
 
+_re_leading_bullet = re.compile(r"^[-*\u2022]\s+")
+
+
 def _split_nonempty_lines(text: str) -> list[str]:
-    text = _s(text).replace("\r\n", "\n").replace("\r", "\n")
+    text = _s(text)
     lines: list[str] = []
     for raw in text.split("\n"):
         line = raw.strip()
         if not line:
             continue
         # normalize leading list markers
-        line = re.sub(r"^[-*\u2022]\s+", "", line)
+        line = _re_leading_bullet.sub("", line)
         lines.append(line)
     return lines
 
@@ -776,21 +925,51 @@ def _render_section_items(title: str, items: list[dict], *, topic_key: str | Non
     return "\n".join(out).rstrip() + "\n"
 
 
-def render_normal(data: dict, *, grades_summary: dict | None = None) -> str:
-    course_name = _md_escape_inline(_s(data.get("course_name")))
-    course_code = _md_escape_inline(_s(data.get("course_code")))
-    description = _normalize_multiline_md(_s(data.get("description")))
+class _Buf:
+    """Append-only text buffer for the renderers; `w` is the bound write method."""
 
-    lines: list[str] = []
-    title_has_code = False
+    __slots__ = ("_io", "w")
+
+    def __init__(self) -> None:
+        self._io = io.StringIO()
+        self.w = self._io.write
+
+    def getvalue(self) -> str:
+        return self._io.getvalue()
+
+
+# Standard content blocks of a normal course README: (TOML key, section title).
+_STANDARD_SECTIONS = (
+    ("course", "课程内容"),
+    ("exam", "考核/考试"),
+    ("lab", "实验/作业"),
+    ("advice", "选课建议"),
+    ("schedule", "课程安排"),
+)
+
+
+def render_normal(data: dict, *, grades_summary: dict | None = None) -> str:
+    # Bind hot helpers to locals (LOAD_FAST) for the per-item loops below.
+    as_list = _as_list
+    s = _s
+    ss = _ss
+    esc = _md_escape_inline
+    split_lines = _split_nonempty_lines
+    quote_line = _render_author_quote_line
+    section_items = _render_section_items
+
+    course_name = esc(s(data.get("course_name")))
+    course_code = esc(s(data.get("course_code")))
+    description = _normalize_multiline_md(s(data.get("description")))
+
+    buf = _Buf()
+    w = buf.w
     if course_code and course_name:
-        lines.append(f"# {course_code} - {course_name}")
-        title_has_code = True
+        w(f"# {course_code} - {course_name}\n")
     else:
-        lines.append(f"# {course_name or course_code or '课程'}")
-    if course_code and not title_has_code:
-        lines.append("")
-        lines.append(f"**课程代码：** {course_code}")
+        w(f"# {course_name or course_code or '课程'}\n")
+        if course_code:
+            w(f"\n**课程代码：** {course_code}\n")
 
     # Optional: insert grading summary badges (from grades_summary.json) near the top,
     # above the description block.
@@ -799,152 +978,135 @@ def render_normal(data: dict, *, grades_summary: dict | None = None) -> str:
         items = _pick_grades_variant(entry)
         badges = _render_grades_badges_from_items(items)
         if badges:
-            lines.append("")
-            lines.extend(badges)
+            w("\n")
+            for badge in badges:
+                w(f"{badge}\n")
 
     if description:
-        lines.append("")
-        lines.append(description)
+        w(f"\n{description}\n")
 
-    lecturers = _as_list(data.get("lecturers"))
+    lecturers = as_list(data.get("lecturers"))
     if lecturers:
-        lines.append("")
-        lines.append("## 授课教师")
-        lines.append("")
+        w("\n## 授课教师\n\n")
         for lec in lecturers:
             if not isinstance(lec, dict):
                 continue
-            name = _md_escape_inline(_s(lec.get("name")).strip())
+            name = esc(s(lec.get("name")))
             if not name:
                 continue
-            lines.append(f"- {name}")
-            reviews = _as_list(lec.get("reviews"))
+            w(f"- {name}\n")
+            reviews = as_list(lec.get("reviews"))
             for rv in reviews:
                 if not isinstance(rv, dict):
                     continue
-                content = _s(rv.get("content")).strip()
+                content = ss(rv.get("content"))
                 author = rv.get("author")
-                content_lines = _split_nonempty_lines(content)
-                for ln in content_lines:
-                    lines.append(f"  - {ln}")
+                content_lines = split_lines(content)
                 if content_lines:
-                    aq = _render_author_quote_line(author, indent="  ")
+                    w("".join([f"  - {ln}\n" for ln in content_lines]))
+                    aq = quote_line(author, indent="  ")
                     if aq:
-                        lines.append(aq)
                         # Keep the following lines out of the blockquote (CommonMark lazy continuation).
-                        lines.append("  ")
+                        w(f"{aq}\n  \n")
 
-    textbooks = _as_list(data.get("textbooks"))
+    textbooks = as_list(data.get("textbooks"))
     if textbooks:
-        lines.append("")
-        lines.append("## 教材")
+        w("\n## 教材\n")
         for tb in textbooks:
             if not isinstance(tb, dict):
                 continue
-            title = _s(tb.get("title")).strip()
+            title = ss(tb.get("title"))
             if not title:
                 continue
-            book_author = _s(tb.get("book_author")).strip()
-            publisher = _s(tb.get("publisher")).strip()
-            edition = _s(tb.get("edition")).strip()
-            tb_type = _s(tb.get("type")).strip()
-            meta = " / ".join([x for x in [book_author, publisher, edition, tb_type] if x])
+            book_author = ss(tb.get("book_author"))
+            publisher = ss(tb.get("publisher"))
+            edition = ss(tb.get("edition"))
+            tb_type = ss(tb.get("type"))
+            meta = " / ".join(filter(None, (book_author, publisher, edition, tb_type)))
             if meta:
-                lines.append(f"- **{title}**（{meta}）")
+                w(f"- **{title}**（{meta}）\n")
             else:
-                lines.append(f"- **{title}**")
+                w(f"- **{title}**\n")
 
-    online = _as_list(data.get("online_resources"))
+    online = as_list(data.get("online_resources"))
     if online:
-        lines.append("")
-        lines.append("## 在线资源")
-        lines.append("")
+        w("\n## 在线资源\n\n")
 
         for r in online:
             if not isinstance(r, dict):
                 continue
-            title = _s(r.get("title")).strip() or _s(r.get("url")).strip()
-            url = _s(r.get("url")).strip()
-            desc = _s(r.get("description")).strip()
+            title = ss(r.get("title")) or ss(r.get("url"))
+            url = ss(r.get("url"))
+            desc = ss(r.get("description"))
             if not title and not url:
                 continue
 
+            tail = f"：{desc}" if desc else ""
             if url:
-                lines.append(f"- [{title}]({url})" + (f"：{desc}" if desc else ""))
+                w(f"- [{title}]({url}){tail}\n")
             else:
-                lines.append(f"- {title}" + (f"：{desc}" if desc else ""))
-
-    # Standard content blocks
-    for key, title in [
-        ("course", "课程内容"),
-        ("exam", "考核/考试"),
-        ("lab", "实验/作业"),
-        ("advice", "选课建议"),
-        ("schedule", "课程安排"),
-    ]:
-        section = _render_section_items(title, _as_list(data.get(key)))
+                w(f"- {title}{tail}\n")
+
+    for key, title in _STANDARD_SECTIONS:
+        section = section_items(title, as_list(data.get(key)))
         if section:
-            lines.append("")
-            lines.append(section.rstrip())
+            w(f"\n{section.rstrip()}\n")
 
     # related_links: do not render signatures
-    related = _as_list(data.get("related_links"))
+    related = as_list(data.get("related_links"))
     if related:
-        lines.append("")
-        lines.append("## 相关链接")
-        lines.append("")
+        w("\n## 相关链接\n\n")
         for item in related:
             if not isinstance(item, dict):
                 continue
-            content = _s(item.get("content")).strip()
+            content = ss(item.get("content"))
             if not content:
                 continue
             # Try to make it a list for readability
-            for ln in content.replace("\r\n", "\n").replace("\r", "\n").split("\n"):
-                lns = ln.strip()
-                if not lns:
-                    continue
-                lines.append(f"- {lns}")
+            w("".join([f"- {lns}\n" for ln in content.split("\n") if (lns := ln.strip())]))
 
-    misc = _as_list(data.get("misc"))
-    misc_section = _render_section_items("其他", misc, topic_key="topic")
+    misc = as_list(data.get("misc"))
+    misc_section = section_items("其他", misc, topic_key="topic")
     if misc_section:
-        lines.append("")
-        lines.append(misc_section.rstrip())
+        w(f"\n{misc_section.rstrip()}\n")
 
-    return "\n".join(lines).rstrip() + "\n"
+    return buf.getvalue().rstrip() + "\n"
 
 
 def render_multi_project(data: dict) -> str:
-    course_name = _md_escape_inline(_s(data.get("course_name")))
-    course_code = _md_escape_inline(_s(data.get("course_code")))
-    description = _normalize_multiline_md(_s(data.get("description")))
-
-    lines: list[str] = []
-    title_has_code = False
+    # Bind hot helpers to locals (LOAD_FAST) for the per-item loops below.
+    as_list = _as_list
+    s = _s
+    ss = _ss
+    esc = _md_escape_inline
+    split_lines = _split_nonempty_lines
+    quote_line = _render_author_quote_line
+    render_block = _render_block
+
+    course_name = esc(s(data.get("course_name")))
+    course_code = esc(s(data.get("course_code")))
+    description = _normalize_multiline_md(s(data.get("description")))
+
+    buf = _Buf()
+    w = buf.w
     if course_code and course_name:
-        lines.append(f"# {course_code} - {course_name}")
-        title_has_code = True
+        w(f"# {course_code} - {course_name}\n")
     else:
-        lines.append(f"# {course_name or course_code or '课程集合'}")
-    if course_code and not title_has_code:
-        lines.append("")
-        lines.append(f"**课程代码：** {course_code}")
+        w(f"# {course_name or course_code or '课程集合'}\n")
+        if course_code:
+            w(f"\n**课程代码：** {course_code}\n")
 
     if description:
-        lines.append("")
-        lines.append(description)
+        w(f"\n{description}\n")
 
-    courses = _as_list(data.get("courses"))
+    courses = as_list(data.get("courses"))
     if courses:
-        lines.append("")
-        lines.append("## 课程列表")
-        lines.append("")
+        w("\n## 课程列表\n\n")
         for c in courses:
             if not isinstance(c, dict):
                 continue
-            name = _md_escape_inline(_s(c.get("name")).strip())
-            code = _md_escape_inline(_s(c.get("code")).strip())
+            name = esc(s(c.get("name")))
+            code = esc(s(c.get("code")))
             header = ""
             if code and name:
                 header = f"{code} - {name}"
@@ -954,100 +1116,144 @@ def render_multi_project(data: dict) -> str:
                 continue
 
             # Extract '基本信息' badges and render them near the course title.
+            # Fields are extracted once here and reused when rendering below.
             basic_info_badges: list[str] = []
-            reviews_all = _as_list(c.get("reviews"))
-            reviews: list[dict] = []
-            for rv in reviews_all:
+            reviews: list[tuple[str, str, object]] = []
+            for rv in as_list(c.get("reviews")):
                 if not isinstance(rv, dict):
                     continue
-                topic_raw = _s(rv.get("topic")).strip()
-                if topic_raw == "基本信息" and not basic_info_badges:
-                    basic_info_badges = _render_basic_info_badges(_s(rv.get("content")))
+                topic = esc(s(rv.get("topic")))
+                content = s(rv.get("content"))
+                if topic == "基本信息" and not basic_info_badges:
+                    basic_info_badges = _render_basic_info_badges(content)
                     continue
-                reviews.append(rv)
+                reviews.append((topic, content, rv.get("author")))
 
-            lines.append("")
-            lines.append(f"### {header}")
             # Title already includes code when available; keep body concise.
+            w(f"\n### {header}\n")
 
             if basic_info_badges:
-                lines.append("")
-                lines.extend(basic_info_badges)
+                w("\n")
+                for badge in basic_info_badges:
+                    w(f"{badge}\n")
 
             # teachers
-            teachers = _as_list(c.get("teachers"))
+            teachers = as_list(c.get("teachers"))
             if teachers:
-                lines.append("")
-                lines.append(f"#### {header} - 授课教师")
-                lines.append("")
+                w(f"\n#### {header} - 授课教师\n\n")
                 for t in teachers:
                     if not isinstance(t, dict):
                         continue
-                    tname = _md_escape_inline(_s(t.get("name")).strip())
+                    tname = esc(s(t.get("name")))
                     if not tname:
                         continue
-                    lines.append(f"- {tname}")
-                    treviews = _as_list(t.get("reviews"))
+                    w(f"- {tname}\n")
+                    treviews = as_list(t.get("reviews"))
                     for rv in treviews:
                         if not isinstance(rv, dict):
                             continue
-                        content = _s(rv.get("content")).strip()
+                        content = ss(rv.get("content"))
                         author = rv.get("author")
-                        content_lines = _split_nonempty_lines(content)
-                        for ln in content_lines:
-                            lines.append(f"  - {ln}")
+                        content_lines = split_lines(content)
                         if content_lines:
-                            aq = _render_author_quote_line(author, indent="  ")
+                            w("".join([f"  - {ln}\n" for ln in content_lines]))
+                            aq = quote_line(author, indent="  ")
                             if aq:
-                                lines.append(aq)
-                                lines.append("  ")
+                                w(f"{aq}\n  \n")
 
             if reviews:
-                lines.append("")
-                lines.append(f"#### {header} - 课程评价")
-                lines.append("")
-                for rv in reviews:
-                    if not isinstance(rv, dict):
-                        continue
-                    topic = _md_escape_inline(_s(rv.get("topic")).strip())
-                    content = _s(rv.get("content"))
-                    author = rv.get("author")
+                w(f"\n#### {header} - 课程评价\n\n")
+                for topic, content, author in reviews:
                     if topic:
-                        lines.append("")
-                        lines.append(f"##### {header} - {topic}")
-                        lines.append("")
-                    block = _render_block(content, author)
+                        w(f"\n##### {header} - {topic}\n\n")
+                    block = render_block(content, author)
                     if block:
-                        lines.append(block)
+                        w(f"{block}\n")
 
-    misc = _as_list(data.get("misc"))
+    misc = as_list(data.get("misc"))
     # multi-project 的 misc 有时没有 topic
     if misc:
-        lines.append("")
-        lines.append("## 其他")
+        w("\n## 其他\n")
         for item in misc:
             if not isinstance(item, dict):
                 continue
-            topic = _md_escape_inline(_s(item.get("topic")).strip())
-            content = _s(item.get("content"))
+            topic = esc(s(item.get("topic")))
+            content = s(item.get("content"))
             author = item.get("author")
             if topic:
-                lines.append("")
-                lines.append(f"### {topic}")
-            block = _render_block(content, author)
+                w(f"\n### {topic}\n")
+            block = render_block(content, author)
             if block:
-                lines.append(block)
+                w(f"{block}\n")
+
+    return buf.getvalue().rstrip() + "\n"
+
+
+def _sidecar_path(toml_path: Path) -> Path:
+    return toml_path.with_name(f"{toml_path.name}.json")
+
+
+def _read_sidecar(raw: bytes) -> dict | None:
+    """Decode a sidecar, or None if it is unreadable (e.g. truncated)."""
+    try:
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except ValueError:
+        # orjson rejects NaN/Infinity and out-of-range ints that json writes.
+        try:
+            data = json.loads(raw)
+        except ValueError:
+            return None
+    return data if isinstance(data, dict) else None
+
+
+def _write_sidecar(sidecar: Path, data: dict) -> None:
+    # Write-then-rename, so an interrupted run never leaves a partial sidecar
+    # that looks newer than its TOML.
+    tmp = sidecar.with_name(f"{sidecar.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(json.dumps(data, ensure_ascii=False, default=str), encoding="utf-8")
+        os.replace(tmp, sidecar)
+    except OSError:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+
+
+def _load_toml_data(toml_path: Path, *, use_cache: bool = False) -> dict:
+    """Parse `toml_path`, optionally through a `<name>.toml.json` sidecar.
 
-    return "\n".join(lines).rstrip() + "\n"
+    With `use_cache`, a sidecar at least as new as the TOML is read instead of
+    re-parsing; otherwise (or if the sidecar cannot be decoded) the TOML is
+    parsed and the sidecar (re)written.
+    Dates and times are stored via str(), which is how `_s` renders them.
+    """
+    sidecar = _sidecar_path(toml_path)
+    if use_cache:
+        try:
+            fresh = sidecar.stat().st_mtime_ns >= toml_path.stat().st_mtime_ns
+            raw = sidecar.read_bytes() if fresh else None
+        except OSError:
+            raw = None
+        if raw is not None:
+            data = _read_sidecar(raw)
+            if data is not None:
+                return _lf_tree(data)
+
+    with toml_path.open("rb") as f:
+        data = _lf_tree(tomllib.load(f))
+    if use_cache:
+        _write_sidecar(sidecar, data)
+    return data
 
 
-def render_readme_from_toml_path(toml_path: Path) -> str:
-    data = tomllib.loads(toml_path.read_text(encoding="utf-8"))
-    repo_type = _s(data.get("repo_type")).strip().lower()
-    grades_summary = _load_grades_summary(toml_path)
+def render_readme_from_toml_path(toml_path: Path, *, use_cache: bool = False) -> str:
+    data = _load_toml_data(toml_path, use_cache=use_cache)
+    repo_type = _ss(data.get("repo_type")).lower()
     if repo_type == "multi-project":
+        # Multi-project READMEs carry no grade badges; skip the lookup.
         return render_multi_project(data)
-    return render_normal(data, grades_summary=grades_summary)
+    return render_normal(data, grades_summary=_load_grades_summary(toml_path))
 
 
 def _default_out_path(input_path: Path) -> Path:
@@ -1058,22 +1264,164 @@ def _default_out_path(input_path: Path) -> Path:
     return input_path.with_name(f"{input_path.stem}_README.md")
 
 
-def convert_one(input_path: Path, output_path: Path, *, overwrite: bool) -> None:
-    md = render_readme_from_toml_path(input_path)
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def _write_bytes(path: Path, data: bytes) -> None:
+    """Write `data` to `path` with raw fd calls, skipping the buffered file object."""
+    fd = os.open(path, _WRITE_FLAGS, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+def convert_one(input_path: Path, output_path: Path, *, overwrite: bool, use_cache: bool = False) -> bool:
+    """Render `input_path` into `output_path`.
+
+    Returns False without touching the file when it already holds exactly the
+    rendered content, so unchanged READMEs keep their mtime.
+    """
+    md = render_readme_from_toml_path(input_path, use_cache=use_cache)
     if output_path.exists() and not overwrite:
         raise FileExistsError(f"Output exists: {output_path} (use --overwrite)")
-    md = _normalize_markdownlint(md)
-    output_path.write_text(md, encoding="utf-8")
+    data = _normalize_markdownlint(md).encode("utf-8")
+    try:
+        # Compare raw bytes: a text-mode read would hide CRLF line endings.
+        if output_path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    _write_bytes(output_path, data)
+    return True
+
+
+def _try_convert(input_path: Path, output_path: Path, overwrite: bool, use_cache: bool) -> tuple[str, str]:
+    """`convert_one`, reporting (outcome, error).
+
+    The outcome is "wrote", "unchanged", "exists" or "failed"; error is the
+    failure message and empty otherwise. Failures are returned rather than
+    raised so one broken TOML neither aborts nor hides the rest of a batch.
+    """
+    try:
+        wrote = convert_one(input_path, output_path, overwrite=overwrite, use_cache=use_cache)
+    except FileExistsError:
+        return "exists", ""
+    except Exception as e:
+        return "failed", f"{type(e).__name__}: {e}"
+    return ("wrote" if wrote else "unchanged"), ""
+
+
+def _convert_many(jobs: list[tuple[Path, Path]], *, overwrite: bool, use_cache: bool = False):
+    """Yield (input_path, output_path, (outcome, error)) for each job, in order.
+
+    Each TOML is independent and CPU-bound, so batches are spread across
+    processes; a single file is converted in-process to skip pool startup.
+    """
+    if len(jobs) <= 1:
+        for p, out in jobs:
+            yield p, out, _try_convert(p, out, overwrite, use_cache)
+        return
+    with ProcessPoolExecutor() as ex:
+        futures = [(p, out, ex.submit(_try_convert, p, out, overwrite, use_cache)) for p, out in jobs]
+        try:
+            for p, out, fut in futures:
+                yield p, out, fut.result()
+        except BaseException:
+            # Abandoned (e.g. Ctrl-C): don't start queued conversions on the way out.
+            ex.shutdown(cancel_futures=True)
+            raise
+
+
+# --all build cache: TOML path -> stats of everything its README depends on.
+_BUILD_CACHE_PATH = Path(".cache") / "readme_gen.json"
+
+
+def _stat_key(path: Path | None) -> tuple[int, int] | None:
+    if path is None:
+        return None
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _build_key(toml_path: Path, output_path: Path) -> tuple:
+    # The output's own stats are part of the key so a hand-edited or deleted
+    # README is regenerated.
+    return (
+        _stat_key(toml_path),
+        _stat_key(output_path),
+        _stat_key(_find_upwards(toml_path, "grades_summary.json")),
+    )
+
+
+def _tuples(value):
+    # JSON has no tuples; restore them so cached keys compare equal to `_build_key`.
+    if isinstance(value, list):
+        return tuple(_tuples(v) for v in value)
+    return value
+
+
+def _load_build_cache() -> dict[str, tuple]:
+    # Plain JSON rather than pickle: the file lives in the working tree, and
+    # loading it must never execute anything.
+    try:
+        cache = json.loads(_BUILD_CACHE_PATH.read_bytes())
+    except Exception:
+        return {}
+    # A different converter version may render differently; start over.
+    if not isinstance(cache, dict) or _tuples(cache.get("generator")) != _stat_key(Path(__file__)):
+        return {}
+    entries = cache.get("entries")
+    if not isinstance(entries, dict):
+        return {}
+    return {k: _tuples(v) for k, v in entries.items()}
+
+
+def _save_build_cache(entries: dict[str, tuple]) -> None:
+    try:
+        _BUILD_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _BUILD_CACHE_PATH.write_text(
+            json.dumps({"generator": _stat_key(Path(__file__)), "entries": entries}, ensure_ascii=False),
+            encoding="utf-8",
+        )
+    except OSError:
+        pass
+
+
+def _scan_tree(root: Path, match) -> list[Path]:
+    """Collect entries below `root` whose name satisfies `match`.
+
+    An `os.scandir` walk: names and directory checks come from the directory
+    listing itself, and only matches are turned into `Path` objects. Like
+    `Path.rglob`, symlinked directories are not descended into.
+    """
+    found: list[Path] = []
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for e in it:
+                    if e.is_dir(follow_symlinks=False):
+                        stack.append(e.path)
+                    if match(e.name):
+                        found.append(Path(e.path))
+        except PermissionError:
+            continue
+    return found
 
 
 def iter_tomls(root: Path) -> list[Path]:
     if root.is_file():
         return [root]
-    # default scan: find readme.toml first, else *.toml
-    readmes = sorted(root.rglob("readme.toml"))
-    if readmes:
-        return readmes
-    return sorted(root.rglob("*.toml"))
+    # default scan: find readme.toml first, else *.toml (one walk for both)
+    tomls = _scan_tree(root, lambda name: name.endswith(".toml"))
+    readmes = [p for p in tomls if p.name == "readme.toml"]
+    return sorted(readmes or tomls)
 
 
 def main() -> int:
@@ -1093,6 +1441,11 @@ def main() -> int:
     parser.add_argument("--overwrite", action="store_true", help="Overwrite existing README.md")
     parser.add_argument("--dry-run", action="store_true", help="Do not write files; just print which would be generated")
     parser.add_argument("--quiet", action="store_true", help="Reduce per-file output; print only summary")
+    parser.add_argument(
+        "--use-cache",
+        action="store_true",
+        help="Reuse parsed TOML from <name>.toml.json sidecars when newer than the TOML (written on first parse)",
+    )
 
     args = parser.parse_args()
     in_path = Path("final") if args.all else Path(args.input)
@@ -1108,27 +1461,70 @@ def main() -> int:
         raise ValueError("--output can only be used when --input points to a single TOML file")
 
     wrote = 0
+    unchanged = 0
     skipped = 0
+    failed = 0
 
-    for p in toml_paths:
-        out = Path(args.output) if args.output else _default_out_path(p)
-        if args.dry_run:
-            if not args.quiet:
-                print(f"{p} -> {out}")
-            continue
-        try:
-            convert_one(p, out, overwrite=args.overwrite)
-        except FileExistsError:
-            skipped += 1
-            if not args.quiet:
-                print(f"Skip {out} (exists)")
-            continue
-        wrote += 1
+    jobs = [(p, Path(args.output) if args.output else _default_out_path(p)) for p in toml_paths]
+    if args.dry_run:
         if not args.quiet:
-            print(f"Wrote {out}")
+            for p, out in jobs:
+                print(f"{p} -> {out}")
+        return 0
+
+    # --all re-runs only convert TOMLs whose inputs or output changed.
+    cache = _load_build_cache() if args.all else None
+    if cache is not None:
+        cached = [cache.get(str(p)) == _build_key(p, out) for p, out in jobs]
+    else:
+        cached = [False] * len(jobs)
+    results = _convert_many(
+        [job for job, hit in zip(jobs, cached) if not hit],
+        overwrite=args.overwrite,
+        use_cache=args.use_cache,
+    )
 
-    if args.quiet and not args.dry_run:
-        print(f"Wrote {wrote} file(s), skipped {skipped} (exists).")
+    # Cache hits and conversions are reported together, in job order.
+    try:
+        for (p, out), hit in zip(jobs, cached):
+            if hit:
+                # Up to date; without --overwrite it is still an existing output.
+                outcome, error = ("unchanged" if args.overwrite else "exists"), ""
+            else:
+                _, _, (outcome, error) = next(results)
+                if cache is not None and outcome in ("wrote", "unchanged"):
+                    cache[str(p)] = _build_key(p, out)
+            if outcome == "failed":
+                failed += 1
+                print(f"Failed {p}: {error}", file=sys.stderr)
+                continue
+            if outcome == "exists":
+                skipped += 1
+                if not args.quiet:
+                    print(f"Skip {out} (exists)")
+                continue
+            if outcome == "unchanged":
+                unchanged += 1
+                if not args.quiet:
+                    print(f"Unchanged {out}")
+                continue
+            wrote += 1
+            if not args.quiet:
+                print(f"Wrote {out}")
+    finally:
+        results.close()
+        # Keep the stamps of everything that did convert, even after an error,
+        # and forget TOMLs that were renamed or deleted.
+        if cache is not None:
+            for stale in cache.keys() - {str(p) for p, _ in jobs}:
+                del cache[stale]
+            _save_build_cache(cache)
+
+    if args.quiet:
+        print(f"Wrote {wrote} file(s), {unchanged} unchanged, skipped {skipped} (exists).")
+    if failed:
+        print(f"Failed to convert {failed} file(s).", file=sys.stderr)
+        return 1
 
     return 0
 
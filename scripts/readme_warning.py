@@ -12,14 +12,18 @@ The block is delimited by HTML comments so it is idempotent.
 from __future__ import annotations
 
 import argparse
+import re
 from pathlib import Path
 
 WARNING_START = "<!-- RDME_TOML_AUTOGEN_WARNING_START -->"
 WARNING_END = "<!-- RDME_TOML_AUTOGEN_WARNING_END -->"
 
+_re_crlf = re.compile(r"\r\n?")
+
 
 def _normalize_newlines(text: str) -> str:
-    return text.replace("\r\n", "\n").replace("\r", "\n")
+    # One pass for both CRLF and lone CR.
+    return _re_crlf.sub("\n", text)
 
 
 def _build_block(message: str) -> str:
@@ -36,26 +40,30 @@ def _build_block(message: str) -> str:
 
 
 def _strip_block(text: str) -> str:
-    if WARNING_START not in text:
-        return text
     start = text.find(WARNING_START)
+    if start == -1:
+        return text
     end = text.find(WARNING_END)
     if end == -1:
         return text
-    end = end + len(WARNING_END)
-    after = text[end:]
-    while after.startswith("\n"):
-        after = after[1:]
+    after = text[end + len(WARNING_END) :].lstrip("\n")
     before = text[:start]
+    if not before:
+        return after
     if before.endswith("\n"):
         before = before[:-1]
-    out = (before + "\n" + after) if before else after
-    return out.lstrip("\n")
+    return "".join((before, "\n", after)).lstrip("\n")
 
 
 def _ensure_block_at_top(text: str, message: str) -> str:
-    text = _strip_block(text)
     block = _build_block(message)
+    if text.startswith(block) and WARNING_END not in message:
+        # Same block already on top: stripping and re-inserting it would
+        # rebuild `text` unchanged, so skip the work.
+        rest = text[len(block) :]
+        if not rest or (rest[0] != "\n" and rest.strip()):
+            return text
+    text = _strip_block(text)
     if not text.strip():
         return block
     return block + text.lstrip("\n")
@@ -0,0 +1,231 @@
+"""Tests for scripts/convert_toml_to_readme.py.
+
+Each `fixtures/<name>.toml` is rendered through the same path as the CLI
+(render + markdownlint) and compared byte-for-byte with `fixtures/<name>.md`;
+the CLI tests (failures, caches) run against copies in a temp tree.
+
+Run with: python -m unittest discover -s tests
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+from pathlib import Path
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+BROKEN_TOML = FIXTURES.parents[1] / "broken" / "readme.toml"
+sys.path.insert(0, str(FIXTURES.parents[1] / "scripts"))
+
+import convert_toml_to_readme as conv  # noqa: E402
+
+
+def _render(toml_path: Path) -> str:
+    return conv._normalize_markdownlint(conv.render_readme_from_toml_path(toml_path))
+
+
+def _run_main(cwd: Path, *argv: str) -> tuple[int, str, str]:
+    """Run the CLI in `cwd`; return (exit code, stdout, stderr)."""
+    out, err = io.StringIO(), io.StringIO()
+    old_cwd = os.getcwd()
+    os.chdir(cwd)
+    try:
+        with mock.patch.object(sys, "argv", ["convert_toml_to_readme.py", *argv]):
+            with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+                code = conv.main()
+    finally:
+        os.chdir(old_cwd)
+    return code, out.getvalue(), err.getvalue()
+
+
+class GoldenReadmeTest(unittest.TestCase):
+    def setUp(self) -> None:
+        conv.clear_caches()
+
+    def test_fixtures_match_golden_readmes(self) -> None:
+        tomls = sorted(FIXTURES.glob("*.toml"))
+        self.assertTrue(tomls)
+        for toml_path in tomls:
+            with self.subTest(fixture=toml_path.name):
+                expected = toml_path.with_suffix(".md").read_text(encoding="utf-8")
+                self.assertEqual(_render(toml_path), expected)
+
+    def test_crlf_toml_renders_like_lf(self) -> None:
+        toml_path = FIXTURES / "markdownlint_normal.toml"
+        expected = toml_path.with_suffix(".md").read_text(encoding="utf-8")
+        md = toml_path.read_text(encoding="utf-8").replace("\n", "\r\n")
+        data = conv._lf_tree(conv.tomllib.loads(md))
+        self.assertEqual(conv._normalize_markdownlint(conv.render_normal(data)), expected)
+
+
+class ConvertOneTest(unittest.TestCase):
+    def setUp(self) -> None:
+        conv.clear_caches()
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.toml_path = Path(tmp.name) / "readme.toml"
+        shutil.copyfile(FIXTURES / "markdownlint_normal.toml", self.toml_path)
+        self.readme = self.toml_path.with_name("README.md")
+
+    def test_unchanged_output_is_not_rewritten(self) -> None:
+        self.assertTrue(conv.convert_one(self.toml_path, self.readme, overwrite=True))
+        mtime_ns = self.readme.stat().st_mtime_ns
+        self.assertFalse(conv.convert_one(self.toml_path, self.readme, overwrite=True))
+        self.assertEqual(self.readme.stat().st_mtime_ns, mtime_ns)
+        self.assertEqual(self.readme.read_text(encoding="utf-8"), _render(self.toml_path))
+
+    def test_crlf_output_is_rewritten(self) -> None:
+        # Byte comparison: same text with CRLF line endings still gets rewritten.
+        self.readme.write_bytes(_render(self.toml_path).replace("\n", "\r\n").encode("utf-8"))
+        self.assertTrue(conv.convert_one(self.toml_path, self.readme, overwrite=True))
+        self.assertNotIn(b"\r", self.readme.read_bytes())
+
+
+class SidecarCacheTest(unittest.TestCase):
+    """`--use-cache`: `<name>.toml.json` sidecars next to the TOML."""
+
+    def setUp(self) -> None:
+        conv.clear_caches()
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.toml_path = Path(tmp.name) / "readme.toml"
+        shutil.copyfile(FIXTURES / "markdownlint_normal.toml", self.toml_path)
+        self.sidecar = conv._sidecar_path(self.toml_path)
+        self.expected = (FIXTURES / "markdownlint_normal.md").read_text(encoding="utf-8")
+
+    def _render_cached(self) -> str:
+        return conv._normalize_markdownlint(conv.render_readme_from_toml_path(self.toml_path, use_cache=True))
+
+    def test_sidecar_is_written_and_reused(self) -> None:
+        self.assertEqual(self._render_cached(), self.expected)
+        self.assertTrue(self.sidecar.exists())
+        self.assertEqual(self._render_cached(), self.expected)
+        # A fresh sidecar is read instead of the TOML.
+        self.sidecar.write_text('{"course_name": "from-sidecar"}', encoding="utf-8")
+        self.assertIn("from-sidecar", self._render_cached())
+
+    def test_corrupt_sidecar_is_a_miss_and_rewritten(self) -> None:
+        self._render_cached()
+        good = self.sidecar.read_bytes()
+        for bad in (good[:50], b"[]"):
+            with self.subTest(sidecar=bad[:10]):
+                self.sidecar.write_bytes(bad)
+                self.assertEqual(self._render_cached(), self.expected)
+                self.assertEqual(self.sidecar.read_bytes(), good)
+
+    def test_stale_sidecar_is_ignored(self) -> None:
+        self.sidecar.write_text('{"course_name": "stale", "repo_type": "normal"}', encoding="utf-8")
+        st = self.toml_path.stat()
+        os.utime(self.sidecar, ns=(st.st_atime_ns, st.st_mtime_ns - 10**9))
+        self.assertEqual(self._render_cached(), self.expected)
+        self.assertNotIn(b"stale", self.sidecar.read_bytes())
+
+
+class ConversionFailureTest(unittest.TestCase):
+    """A TOML that fails to convert is reported and makes the CLI exit 1."""
+
+    def setUp(self) -> None:
+        conv.clear_caches()
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        sources = (
+            ("A", FIXTURES / "markdownlint_normal.toml"),
+            ("B", BROKEN_TOML),
+            ("C", FIXTURES / "markdownlint_multi.toml"),
+        )
+        for name, src in sources:
+            dst = self.root / "final" / name / "readme.toml"
+            dst.parent.mkdir(parents=True)
+            shutil.copyfile(src, dst)
+
+    def test_batch_converts_the_rest_and_exits_1(self) -> None:
+        code, out, err = _run_main(self.root, "--input", "final", "--overwrite")
+        self.assertEqual(code, 1)
+        # Good READMEs are written and reported in sorted order.
+        self.assertEqual(out, "Wrote final/A/README.md\nWrote final/C/README.md\n")
+        for name, fixture in (("A", "markdownlint_normal.md"), ("C", "markdownlint_multi.md")):
+            written = (self.root / "final" / name / "README.md").read_text(encoding="utf-8")
+            self.assertEqual(written, (FIXTURES / fixture).read_text(encoding="utf-8"))
+        self.assertFalse((self.root / "final" / "B" / "README.md").exists())
+        self.assertTrue(err.startswith("Failed final/B/readme.toml: TOMLDecodeError: "), err)
+        self.assertTrue(err.endswith("Failed to convert 1 file(s).\n"), err)
+
+    def test_single_file_parse_error_exits_1(self) -> None:
+        # The CI workflow runs exactly this and relies on the exit code.
+        code, out, err = _run_main(self.root / "final" / "B", "--input", "readme.toml", "--overwrite")
+        self.assertEqual(code, 1)
+        self.assertEqual(out, "")
+        self.assertIn("Failed readme.toml: TOMLDecodeError", err)
+        self.assertFalse((self.root / "final" / "B" / "README.md").exists())
+
+
+class BuildCacheTest(unittest.TestCase):
+    """`--all` build cache in `.cache/readme_gen.json`."""
+
+    def setUp(self) -> None:
+        conv.clear_caches()
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        self.toml_path = self.root / "final" / "A" / "readme.toml"
+        self.toml_path.parent.mkdir(parents=True)
+        shutil.copyfile(FIXTURES / "markdownlint_normal.toml", self.toml_path)
+        self.readme = self.toml_path.with_name("README.md")
+        self.grades = self.root / "final" / "grades_summary.json"
+        self.grades.write_text("{}", encoding="utf-8")
+
+    def _run(self, *argv: str) -> tuple[str, int]:
+        """Run `--all` and return (stdout, number of TOMLs actually converted)."""
+        with mock.patch.object(conv, "_try_convert", wraps=conv._try_convert) as spy:
+            code, out, _ = _run_main(self.root, "--all", *argv)
+        self.assertEqual(code, 0)
+        return out, spy.call_count
+
+    def test_hit_skips_conversion(self) -> None:
+        self.assertEqual(self._run("--overwrite"), ("Wrote final/A/README.md\n", 1))
+        self.assertEqual(self._run("--overwrite"), ("Unchanged final/A/README.md\n", 0))
+
+    def test_hit_without_overwrite_reports_skip(self) -> None:
+        self._run("--overwrite")
+        out, converted = self._run("--quiet")
+        self.assertEqual(converted, 0)
+        self.assertEqual(out, "Wrote 0 file(s), 0 unchanged, skipped 1 (exists).\n")
+
+    def test_edits_invalidate_entry(self) -> None:
+        self._run("--overwrite")
+        edits = {
+            "toml": lambda: self.toml_path.write_text(
+                self.toml_path.read_text(encoding="utf-8") + "\n", encoding="utf-8"
+            ),
+            "readme": lambda: self.readme.write_text("hand edit\n", encoding="utf-8"),
+            "grades_summary": lambda: self.grades.write_text('{"OTHER": []}', encoding="utf-8"),
+        }
+        for name, edit in edits.items():
+            with self.subTest(edited=name):
+                edit()
+                self.assertEqual(self._run("--overwrite")[1], 1)
+                self.assertEqual(self._run("--overwrite")[1], 0)
+        self.assertEqual(self.readme.read_text(encoding="utf-8"), _render(self.toml_path))
+
+    def test_removed_toml_is_dropped(self) -> None:
+        other = self.root / "final" / "B" / "readme.toml"
+        other.parent.mkdir()
+        shutil.copyfile(self.toml_path, other)
+        # Two jobs go through the process pool, which cannot pickle the spy.
+        self.assertEqual(_run_main(self.root, "--all", "--overwrite")[0], 0)
+        shutil.rmtree(other.parent)
+        self._run("--overwrite")
+        cache = json.loads((self.root / ".cache" / "readme_gen.json").read_text(encoding="utf-8"))
+        self.assertEqual(list(cache["entries"]), [str(Path("final/A/readme.toml"))])
+
+
+if __name__ == "__main__":
+    unittest.main()